@@ -4,9 +4,24 @@
 
 import os
 import re
+import mmap
 import logging
+import multiprocessing
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson  # 可选依赖，解析 JSON 更快
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick_replace  # 可选的 Cython 扩展，见 ahocorasick_replace.pyx
+except ImportError:
+    ahocorasick_replace = None
 
 # 配置日志
 def setup_logger():
@@ -29,17 +44,23 @@ def setup_logger():
     return logging.getLogger()
 
 def load_replacements():
-    """从外部JSON文件加载替换字典"""
+    """
+    从外部JSON文件加载替换字典
+
+    返回 (替换字典, 多字符替换词的正则, 单字符替换词的正则)，后者见 build_char_pattern
+    """
     json_file = 'replacements.json'
     
     if not os.path.exists(json_file):
         print(f"错误: 找不到配置文件 {json_file}")
         print("请确保 replacements.json 文件存在于程序目录中")
-        return None
+        return None, None, None
     
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，下面的异常处理同样适用
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # 合并所有分类的替换规则
         replacements = {}
@@ -51,6 +72,11 @@ def load_replacements():
             else:  # 如果是旧的平铺格式，直接添加
                 replacements[key] = value
         
+        # 替换后的正文要按行与原行对齐，键或值中含换行符的规则不支持，直接跳过
+        for old_text in [k for k, v in replacements.items() if '\n' in k or '\n' in v]:
+            print(f"跳过包含换行符的规则: {old_text!r}")
+            del replacements[old_text]
+        
         print(f"成功加载 {len(replacements)} 个替换规则")
         
         # 按分类显示加载的规则数量
@@ -58,13 +84,14 @@ def load_replacements():
             if not category.startswith('_') and isinstance(rules, dict):
                 print(f"  - {category}: {len(rules)} 个规则")
         
-        return replacements
+        multi = {k: v for k, v in replacements.items() if len(k) > 1}
+        return replacements, build_pattern(multi), build_char_pattern(replacements)
     except json.JSONDecodeError as e:
         print(f"JSON文件格式错误: {e}")
-        return None
+        return None, None, None
     except Exception as e:
         print(f"加载JSON文件失败: {e}")
-        return None
+        return None, None, None
 
 # 支持的文件格式配置
 SUPPORTED_EXTENSIONS = {
@@ -76,6 +103,18 @@ SUPPORTED_EXTENSIONS = {
     '.vtt': 'WebVTT字幕文件'
 }
 
+# 不带点的扩展名集合，遍历目录时用于快速判断
+EXT_SET = frozenset(ext.lstrip('.') for ext in SUPPORTED_EXTENSIONS)
+
+# 规则数达到该值时改用 Aho-Corasick 扩展（规则较少时正则更快）
+AC_MIN_RULES = 500
+
+# 读写文件时使用的缓冲区大小（默认的 8 KiB 偏小）
+FILE_BUFFER_SIZE = 128 * 1024
+
+# 达到该大小的文件通过 mmap 读取
+MMAP_MIN_SIZE = 1024 * 1024
+
 # 时间戳的正则表达式模式
 TIMESTAMP_PATTERNS = {
     'lrc': re.compile(r'^(\[\d{2}:\d{2}(.\d{2})?\])(.*)$'),
@@ -89,42 +128,182 @@ def detect_file_type(file_path):
     _, ext = os.path.splitext(file_path.lower())
     return ext
 
-def process_lrc_content(line, replacements, replacement_counts, empty_line_count):
-    """处理LRC格式内容"""
+@lru_cache(maxsize=1)
+def _compile_pattern(keys):
+    """编译替换词交替正则（按替换词集合缓存，避免重复编译）"""
+    if not keys:
+        return re.compile(r'(?!)')  # 没有规则时不匹配任何内容
+    # 按长度降序排列，使同一位置上较长的替换词优先匹配（最左最长）
+    return re.compile('|'.join(map(re.escape, sorted(keys, key=lambda k: (-len(k), k)))))
+
+def build_pattern(replacements):
+    """将所有替换词编译为一个交替正则表达式"""
+    return _compile_pattern(frozenset(replacements))
+
+def build_char_pattern(replacements):
+    """
+    将所有单字符替换词（删除语气词、标点等）编译为一个字符集正则
+
+    单字符规则总是先于多字符规则执行（见 replace_lines），删除字符后
+    新拼合出的多字符替换词同样会被替换，例如 日嗯之 → 日之 → 日支
+    不使用 str.translate：对以中文为主的文本，字符集正则快一个数量级
+    没有单字符规则时返回 None
+    """
+    single = sorted(k for k in replacements if len(k) == 1)
+    if not single:
+        return None
+    return re.compile('[' + ''.join(map(re.escape, single)) + ']')
+
+# 各格式不参与替换的内容，多行模式下逐行匹配，与 TIMESTAMP_PATTERNS 及各处理函数对应
+# 删去后每行剩下的就是原先逐行处理时参与替换的正文（行首尾的空白也不参与替换）
+# [^\S\n] 表示不含换行的空白字符
+PROTECTED_PATTERNS = {
+    # 时间戳及其后的空白保留；不含时间戳的行（如歌曲信息行）整行保留
+    '.lrc': re.compile(r'^[^\S\n]*\[\d{2}:\d{2}(?:.\d{2})?\][^\S\n]*|^(?![^\S\n]*\[\d{2}:\d{2}(?:.\d{2})?\]).+$|[^\S\n]+$', re.M),
+    # 字幕序号行和时间戳行整行保留
+    '.srt': re.compile(r'^[^\S\n]*(?:\d+|\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3})[^\S\n]*$|^[^\S\n]+|[^\S\n]+$', re.M),
+    # 对话行前缀保留；非对话行（样式定义等）整行保留
+    '.ass': re.compile(r'^[^\S\n]*Dialogue: .+?,|^(?![^\S\n]*Dialogue: .+?,).+$|[^\S\n]+$', re.M),
+}
+PROTECTED_PATTERNS['.ssa'] = PROTECTED_PATTERNS['.ass']
+
+# 各正则对应的 Aho-Corasick 自动机（每个进程只构建一次），见 get_automaton
+_automatons = {}
+
+def get_automaton(pattern, replacements):
+    """
+    取得与 pattern 包含相同替换词的 Aho-Corasick 自动机
+
+    未编译扩展或规则数少于 AC_MIN_RULES 时返回 None
+    """
+    if pattern not in _automatons:
+        automaton = None
+        if ahocorasick_replace is not None:
+            keys = [k for k in replacements if pattern.fullmatch(k)]
+            if len(keys) >= AC_MIN_RULES:
+                automaton = ahocorasick_replace.Automaton(keys)
+        _automatons[pattern] = automaton
+    return _automatons[pattern]
+
+def apply_replacements(text, pattern, replacements, replacement_counts):
+    """
+    单遍扫描文本并应用 pattern 中的替换规则
+
+    text 中不应含有需要原样保留的内容（见 replace_lines），返回替换后的文本
+    """
+    # 规则很多时使用 Cython 扩展
+    automaton = get_automaton(pattern, replacements)
+    if automaton is not None:
+        replaced_text, counts = ahocorasick_replace.replace_all(text, automaton, replacements)
+        replacement_counts.update(counts)
+        return replaced_text
+    
+    def replace_match(match):
+        old_text = match.group(0)
+        replacement_counts[old_text] += 1
+        return replacements[old_text]
+    
+    return pattern.sub(replace_match, text)
+
+def replace_lines(content, lines, file_type, pattern, replacements, replacement_counts, char_pattern=None):
+    """
+    对文件内容应用替换规则，返回与 lines 一一对应的替换后正文，没有发生替换时返回 None
+
+    序号、时间戳等不参与替换的内容（见 PROTECTED_PATTERNS）先整体删去，
+    剩下的正文一次完成替换；替换规则不含换行符，因此替换前后的正文可按 \n 与原行对齐
+    """
+    # 整个文件中找不到任何替换词时无需拆分保留内容（大多数文件如此）
+    if pattern.search(content) is None and (char_pattern is None or char_pattern.search(content) is None):
+        return None
+    
+    protected_pattern = PROTECTED_PATTERNS.get(file_type)
+    text = content if protected_pattern is None else protected_pattern.sub('', content)
+    original_text = text
+    
+    # 分两步替换：先一次完成单字符规则（删除语气词、标点等），
+    # 再匹配其余规则，与原先按配置顺序先删语气词、再修正术语的效果一致
+    if char_pattern is not None:
+        text = apply_replacements(text, char_pattern, replacements, replacement_counts)
+    text = apply_replacements(text, pattern, replacements, replacement_counts)
+    
+    if text == original_text:  # 大多数文件没有需要替换的内容
+        return None
+    
+    # 末尾的换行会多拆出一个空串，截去后与 lines 对齐
+    return text.split('\n')[:len(lines)]
+
+def read_text_file(file_path):
+    """
+    读取文本文件内容，换行符统一为 \n（与文本模式读取一致）
+
+    大文件通过 mmap 直接解码，省去文本模式逐块解码和拼接的开销
+    """
+    if os.path.getsize(file_path) < MMAP_MIN_SIZE:
+        with open(file_path, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+            return f.read()
+    
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def split_lines(content):
+    """
+    按换行符拆分文件内容，各行不含换行符（末尾换行不产生空行）
+
+    不使用 str.splitlines()，因为它还会在 \x0c、\u2028 等字符处断行，
+    与原先 readlines() 的行为不一致
+    """
+    lines = content.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+def process_lrc_content(line, replaced_lyrics, empty_line_count):
+    """处理LRC格式内容，replaced_lyrics 为替换后的歌词（为 None 时没有发生替换）"""
     original_line = line.strip()
     if not original_line:
-        return None, False
+        return None
+    
+    # 不以 [ 开头的行不可能含时间戳，无需运行正则
+    if original_line[0] != '[':
+        return original_line
     
     # 提取时间戳和歌词内容
     timestamp_match = TIMESTAMP_PATTERNS['lrc'].match(original_line)
     
     if timestamp_match:
         timestamp = timestamp_match.group(1)
-        lyrics = timestamp_match.group(3).strip()
-        
-        # 应用替换规则
-        modified = False
-        for old_text, new_text in replacements.items():
-            if old_text in lyrics:
-                count = lyrics.count(old_text)
-                replacement_counts[old_text] = replacement_counts.get(old_text, 0) + count
-                lyrics = lyrics.replace(old_text, new_text)
-                modified = True
+        # 歌词的替换已在整个文件上完成（见 replace_lines）
+        if replaced_lyrics is None:
+            lyrics = timestamp_match.group(3).strip()
+        else:
+            lyrics = replaced_lyrics
         
         # 如果替换后歌词为空，则跳过这一行
         if not lyrics:
             empty_line_count[0] += 1
-            return None, True
+            return None
         
-        return f"{timestamp}{lyrics}\n", modified
+        return f"{timestamp}{lyrics}"
     else:
         # 保留不包含时间戳的行（如歌曲信息行）
-        return original_line + '\n', False
+        return original_line
+
+def process_lrc_lines(lines, replaced_lines, empty_line_count):
+    """逐行处理LRC格式内容，与其他格式的处理函数接口一致"""
+    processed_lines = []
+    for i, line in enumerate(lines):
+        replaced_lyrics = None if replaced_lines is None else replaced_lines[i]
+        processed_line = process_lrc_content(line, replaced_lyrics, empty_line_count)
+        if processed_line is not None:
+            processed_lines.append(processed_line)
+    return processed_lines
 
-def process_srt_content(lines, replacements, replacement_counts, empty_line_count):
+def process_srt_content(lines, replaced_lines, empty_line_count):
     """处理SRT格式内容"""
     processed_lines = []
-    modified = False
     i = 0
     consecutive_empty_lines = 0  # 记录连续空行数量
     
@@ -136,11 +315,10 @@ def process_srt_content(lines, replacements, replacement_counts, empty_line_coun
             consecutive_empty_lines += 1
             # 只保留一个空行，如果有多个连续空行则删除多余的
             if consecutive_empty_lines == 1:
-                processed_lines.append('\n')  # 保留第一个空行
+                processed_lines.append('')  # 保留第一个空行
             else:
                 # 多余的空行被删除，计入删除计数
                 empty_line_count[0] += 1
-                modified = True
             i += 1
             continue
         else:
@@ -149,49 +327,36 @@ def process_srt_content(lines, replacements, replacement_counts, empty_line_coun
         
         # 字幕序号
         if line.isdigit():
-            processed_lines.append(line + '\n')
+            processed_lines.append(line)
             i += 1
             continue
         
         # 时间戳行
         if TIMESTAMP_PATTERNS['srt'].match(line):
-            processed_lines.append(line + '\n')
+            processed_lines.append(line)
             i += 1
             continue
         
-        # 字幕内容行
-        subtitle_text = line
-        original_subtitle = subtitle_text
-        
-        for old_text, new_text in replacements.items():
-            if old_text in subtitle_text:
-                count = subtitle_text.count(old_text)
-                replacement_counts[old_text] = replacement_counts.get(old_text, 0) + count
-                subtitle_text = subtitle_text.replace(old_text, new_text)
-        
-        # 检查是否发生了替换
-        if subtitle_text != original_subtitle:
-            modified = True
+        # 字幕内容行（替换已在整个文件上完成）
+        subtitle_text = line if replaced_lines is None else replaced_lines[i]
         
         # 只有当字幕内容完全为空时才计入空行删除（这种情况很少见）
         if subtitle_text.strip():
-            processed_lines.append(subtitle_text + '\n')
+            processed_lines.append(subtitle_text)
         else:
             empty_line_count[0] += 1
-            modified = True
             # 即使内容为空，也要保留一个空行来维持SRT格式
-            processed_lines.append('\n')
+            processed_lines.append('')
         
         i += 1
     
-    return processed_lines, modified
+    return processed_lines
 
-def process_ass_content(lines, replacements, replacement_counts, empty_line_count):
+def process_ass_content(lines, replaced_lines, empty_line_count):
     """处理ASS/SSA格式内容"""
     processed_lines = []
-    modified = False
     
-    for line in lines:
+    for i, line in enumerate(lines):
         original_line = line.strip()
         
         if not original_line:
@@ -202,64 +367,60 @@ def process_ass_content(lines, replacements, replacement_counts, empty_line_coun
         
         if dialogue_match:
             dialogue_prefix = dialogue_match.group(1)
-            dialogue_text = dialogue_match.group(2)
-            
-            # 应用替换规则到对话内容
-            for old_text, new_text in replacements.items():
-                if old_text in dialogue_text:
-                    count = dialogue_text.count(old_text)
-                    replacement_counts[old_text] = replacement_counts.get(old_text, 0) + count
-                    dialogue_text = dialogue_text.replace(old_text, new_text)
-                    modified = True
+            # 对话内容的替换已在整个文件上完成
+            if replaced_lines is None:
+                dialogue_text = dialogue_match.group(2)
+            else:
+                dialogue_text = replaced_lines[i]
             
             if dialogue_text.strip():
-                processed_lines.append(f"{dialogue_prefix}{dialogue_text}\n")
+                processed_lines.append(f"{dialogue_prefix}{dialogue_text}")
             else:
                 empty_line_count[0] += 1
-                modified = True
         else:
             # 保留非对话行（样式定义等）
-            processed_lines.append(original_line + '\n')
+            processed_lines.append(original_line)
     
-    return processed_lines, modified
+    return processed_lines
 
-def process_txt_content(lines, replacements, replacement_counts, empty_line_count):
+def process_txt_content(lines, replaced_lines, empty_line_count):
     """处理纯文本内容"""
     processed_lines = []
-    modified = False
     
-    for line in lines:
-        original_line = line.rstrip('\n\r')
-        
-        if not original_line.strip():
+    # 行内已不含换行符（读取时统一为 \n 并按 \n 拆分），空白判断用 isspace() 避免生成新字符串
+    for i, line in enumerate(lines):
+        if not line or line.isspace():
             continue
         
-        # 应用替换规则
-        processed_text = original_line
-        for old_text, new_text in replacements.items():
-            if old_text in processed_text:
-                count = processed_text.count(old_text)
-                replacement_counts[old_text] = replacement_counts.get(old_text, 0) + count
-                processed_text = processed_text.replace(old_text, new_text)
-                modified = True
-        
-        if processed_text.strip():
-            processed_lines.append(processed_text + '\n')
+        processed_text = line if replaced_lines is None else replaced_lines[i]
+        if processed_text and not processed_text.isspace():
+            processed_lines.append(processed_text)
         else:
             empty_line_count[0] += 1
-            modified = True
     
-    return processed_lines, modified
+    return processed_lines
+
+# 各文件格式对应的处理函数，新增格式时在此注册
+HANDLERS = {
+    '.lrc': process_lrc_lines,
+    '.srt': process_srt_content,
+    '.ass': process_ass_content,
+    '.ssa': process_ass_content,
+    '.txt': process_txt_content,
+    '.vtt': process_txt_content,
+}
 
-def process_text_file(file_path, replacements, replacement_counts, empty_line_count):
+def process_text_file(file_path, pattern, replacements, replacement_counts, empty_line_count, char_pattern=None):
     """
     处理单个文本文件
     
     参数:
     file_path: 文件路径
+    pattern: 由多字符替换词编译的正则表达式
     replacements: 替换字典
-    replacement_counts: 记录每个替换词被使用的次数
+    replacement_counts: 记录每个替换词被使用的次数（collections.Counter）
     empty_line_count: 记录删除的空行数
+    char_pattern: 单字符替换词的正则（见 build_char_pattern），没有单字符规则时为 None
 
     返回:
     bool: 文件是否被修改
@@ -269,49 +430,62 @@ def process_text_file(file_path, replacements, replacement_counts, empty_line_co
         file_type = detect_file_type(file_path)
         
         # 读取文件内容
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        content = read_text_file(file_path)
         
-        processed_lines = []
-        modified = False
+        # 对整个文件内容执行一次替换，序号、时间戳等内容原样保留
+        lines = split_lines(content)
+        replaced_lines = replace_lines(content, lines, file_type, pattern, replacements,
+                                       replacement_counts, char_pattern)
         
-        # 根据文件类型选择处理方法
-        if file_type == '.lrc':
-            for line in lines:
-                processed_line, line_modified = process_lrc_content(line, replacements, replacement_counts, empty_line_count)
-                if processed_line is not None:
-                    processed_lines.append(processed_line)
-                if line_modified:
-                    modified = True
-                    
-        elif file_type == '.srt':
-            processed_lines, modified = process_srt_content(lines, replacements, replacement_counts, empty_line_count)
-            
-        elif file_type in ['.ass', '.ssa']:
-            processed_lines, modified = process_ass_content(lines, replacements, replacement_counts, empty_line_count)
-            
-        elif file_type in ['.txt', '.vtt']:
-            processed_lines, modified = process_txt_content(lines, replacements, replacement_counts, empty_line_count)
-            
-        else:
-            # 对于其他格式，按纯文本处理
-            processed_lines, modified = process_txt_content(lines, replacements, replacement_counts, empty_line_count)
+        # 根据文件类型选择处理方法，其他格式按纯文本处理
+        handler = HANDLERS.get(file_type, process_txt_content)
+        processed_lines = handler(lines, replaced_lines, empty_line_count)
+        
+        # 末尾追加空串，使 join 一次生成带结尾换行的完整内容，无需再拼接复制一次
+        if processed_lines:
+            processed_lines.append('')
+        new_content = '\n'.join(processed_lines)
         
-        # 如果文件被修改，则写回文件
-        if modified:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(processed_lines)
+        # 只有内容确实发生变化时才写回文件
+        if new_content != content:
+            with open(file_path, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+                f.write(new_content)
             return True
         return False
             
     except Exception as e:
         return False
 
+# 子进程使用的替换字典、多字符和单字符替换正则，由 init_worker 在进程启动时设置一次
+_worker_replacements = None
+_worker_pattern = None
+_worker_char_pattern = None
+
+def init_worker(replacements, pattern, char_pattern):
+    """子进程初始化：保存替换字典和两个替换正则，避免每个任务重复传递"""
+    global _worker_replacements, _worker_pattern, _worker_char_pattern
+    _worker_replacements = replacements
+    _worker_pattern = pattern
+    _worker_char_pattern = char_pattern
+
+def process_file_task(file_path):
+    """
+    在子进程中处理单个文件
+
+    返回:
+    (文件路径, 是否被修改, 该文件的替换词计数, 该文件删除的空行数)
+    """
+    replacement_counts = Counter()
+    empty_line_count = [0]
+    modified = process_text_file(file_path, _worker_pattern, _worker_replacements,
+                                 replacement_counts, empty_line_count, _worker_char_pattern)
+    return file_path, modified, replacement_counts, empty_line_count[0]
+
 def process_directory(directory_path, logger):
     """处理指定目录下的所有支持格式的文本文件（包括子目录）"""
     
     # 加载替换字典
-    replacements = load_replacements()
+    replacements, pattern, char_pattern = load_replacements()
     if replacements is None:
         logger.error("无法加载替换字典，程序退出")
         return
@@ -323,11 +497,11 @@ def process_directory(directory_path, logger):
         'total_files': 0,
         'modified_files': 0,
         'error_files': 0,
-        'file_types': {}
+        'file_types': Counter()
     }
     
     # 替换词计数器
-    replacement_counts = {}
+    replacement_counts = Counter()
     
     # 空行计数器 (使用列表以便能在函数间修改)
     empty_line_count = [0]
@@ -335,30 +509,43 @@ def process_directory(directory_path, logger):
     logger.info(f"开始处理目录: {directory_path}")
     logger.info(f"支持的文件格式: {', '.join(SUPPORTED_EXTENSIONS.keys())}")
     
-    # 遍历目录及其子目录
+    # 遍历目录及其子目录，收集需要处理的文件
+    file_paths = []
     for root, _, files in os.walk(directory_path):
         for file in files:
-            file_ext = os.path.splitext(file.lower())[1]
+            name, _, file_ext = file.rpartition('.')
+            file_ext = file_ext.lower()
             
-            # 检查是否为支持的文件格式
-            if file_ext in SUPPORTED_EXTENSIONS:
+            # 检查是否为支持的文件格式（不含点或只有开头的点的文件名如 .txt、..srt 没有扩展名，与 os.path.splitext 一致）
+            if name.strip('.') and file_ext in EXT_SET:
                 stats['total_files'] += 1
-                stats['file_types'][file_ext] = stats['file_types'].get(file_ext, 0) + 1
-                
-                file_path = os.path.join(root, file)
-                
-                try:
-                    if process_text_file(file_path, replacements, replacement_counts, empty_line_count):
-                        stats['modified_files'] += 1
-                        logger.info(f"已处理: {file_path}")
-                except Exception as e:
-                    stats['error_files'] += 1
-                    logger.error(f"处理文件出错 {file_path}: {str(e)}")
+                stats['file_types'][file_ext] += 1
+                file_paths.append(os.path.join(root, file))
+    
+    # 各文件相互独立，使用多进程并行处理（进程数取默认值，Windows 上会自动限制在 61 以内）
+    with ProcessPoolExecutor(initializer=init_worker, initargs=(replacements, pattern, char_pattern)) as executor:
+        futures = [executor.submit(process_file_task, file_path) for file_path in file_paths]
+        
+        # 按提交顺序汇总结果，保证日志和统计顺序与遍历顺序一致
+        for file_path, future in zip(file_paths, futures):
+            try:
+                _, modified, file_counts, file_empty_lines = future.result()
+            except Exception as e:
+                stats['error_files'] += 1
+                logger.error(f"处理文件出错 {file_path}: {str(e)}")
+                continue
+            
+            replacement_counts.update(file_counts)
+            empty_line_count[0] += file_empty_lines
+            
+            if modified:
+                stats['modified_files'] += 1
+                logger.info(f"已处理: {file_path}")
     
     # 输出文件类型统计
     logger.info("文件类型统计:")
     for file_ext, count in stats['file_types'].items():
-        logger.info(f"  {file_ext} ({SUPPORTED_EXTENSIONS[file_ext]}): {count} 个文件")
+        logger.info(f"  .{file_ext} ({SUPPORTED_EXTENSIONS['.' + file_ext]}): {count} 个文件")
     
     # 输出替换词统计信息
     if replacement_counts:
@@ -397,4 +584,6 @@ def main():
     input("处理完成，按Enter键退出...")
 
 if __name__ == "__main__":
+    # 打包为 Windows 可执行文件后，子进程需要此调用才能正常启动
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
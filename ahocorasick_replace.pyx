@@ -0,0 +1,114 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# 用途
+# ReplaceText.py 的可选加速扩展：用 Aho-Corasick 自动机单遍完成多模式替换
+# 编译: cythonize -i ahocorasick_replace.pyx
+# 未编译时 ReplaceText.py 自动使用正则实现，结果相同
+# 传入的文本只含需要替换的正文：序号、时间戳、对话前缀等由 ReplaceText.replace_lines
+# 事先拆出，因此 SRT/LRC/ASS 等字幕格式与纯文本一样可以使用本扩展
+
+cdef class Automaton:
+    """由替换词构建的 Aho-Corasick 自动机"""
+    cdef list goto        # 每个状态的转移表 {字符: 下一状态}
+    cdef list fail        # 失败指针
+    cdef list lengths     # 在该状态结束的替换词长度（0 表示不是替换词结尾）
+    cdef list words       # 在该状态结束的替换词
+    cdef list dict_link   # 沿失败指针最近的替换词结尾状态（-1 表示没有）
+
+    def __init__(self, keys):
+        cdef Py_ssize_t state, next_state, fallback
+        cdef Py_UCS4 ch
+
+        self.goto = [{}]
+        self.fail = [0]
+        self.lengths = [0]
+        self.words = [None]
+        self.dict_link = [-1]
+
+        # 构建字典树
+        for key in keys:
+            if not key:
+                continue
+            state = 0
+            for ch in key:
+                next_state = self.goto[state].get(ch, -1)
+                if next_state == -1:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.lengths.append(0)
+                    self.words.append(None)
+                    self.dict_link.append(-1)
+                state = next_state
+            self.lengths[state] = len(key)
+            self.words[state] = key
+
+        # 按层遍历计算失败指针和输出链
+        queue = list(self.goto[0].values())
+        cdef Py_ssize_t head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self.goto[state].items():
+                if state:
+                    fallback = self.fail[state]
+                    while fallback and ch not in self.goto[fallback]:
+                        fallback = self.fail[fallback]
+                    fallback = self.goto[fallback].get(ch, 0)
+                else:
+                    fallback = 0
+                self.fail[next_state] = fallback
+                self.dict_link[next_state] = fallback if self.lengths[fallback] else self.dict_link[fallback]
+                queue.append(next_state)
+
+
+def replace_all(str text, Automaton automaton, dict replacements):
+    """
+    单遍扫描文本并替换所有替换词
+
+    同一位置有多个替换词时取最长的，已替换的部分不再参与匹配（最左最长），
+    与 ReplaceText.build_pattern 生成的正则结果一致
+    返回 (替换后的文本, {替换词: 替换次数})
+    """
+    cdef Py_ssize_t i, n = len(text), state = 0, s, start, length, last
+    cdef Py_UCS4 ch
+    cdef list goto = automaton.goto
+    cdef list fail = automaton.fail
+    cdef list lengths = automaton.lengths
+    cdef list dict_link = automaton.dict_link
+    cdef dict transitions
+    cdef dict longest = {}  # 起始位置 -> 该位置最长替换词所在状态
+
+    for i in range(n):
+        ch = text[i]
+        transitions = goto[state]
+        while state and ch not in transitions:
+            state = fail[state]
+            transitions = goto[state]
+        state = transitions.get(ch, 0)
+
+        s = state if lengths[state] else dict_link[state]
+        while s > 0:
+            length = lengths[s]
+            start = i - length + 1
+            if start not in longest or lengths[longest[start]] < length:
+                longest[start] = s
+            s = dict_link[s]
+
+    if not longest:
+        return text, {}
+
+    cdef list parts = []
+    cdef dict counts = {}
+    last = 0
+    for start in sorted(longest):
+        if start < last:  # 与已替换的部分重叠，跳过
+            continue
+        s = longest[start]
+        word = automaton.words[s]
+        parts.append(text[last:start])
+        parts.append(replacements[word])
+        counts[word] = counts.get(word, 0) + 1
+        last = start + lengths[s]
+    parts.append(text[last:])
+    return ''.join(parts), counts
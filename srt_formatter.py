@@ -1,18 +1,25 @@
 import os
-import re
+
+# 读写文件时使用的缓冲区大小（默认的 8 KiB 偏小）
+FILE_BUFFER_SIZE = 128 * 1024
 
 def format_srt_file(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
         content = f.read()
     
-    # 在每个序号行前添加空行
-    formatted_content = re.sub(r'(\n\d+\n)', r'\n\1', content)
+    # 在每个序号行前添加空行（已有空行的不再重复添加）
+    lines = []
+    for line in content.split('\n'):
+        if line.isdigit() and lines and lines[-1] != '':
+            lines.append('')
+        lines.append(line)
+    formatted_content = '\n'.join(lines)
     
     # 确保文件末尾有一个空行
     if not formatted_content.endswith('\n\n'):
         formatted_content += '\n'
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with open(file_path, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
         f.write(formatted_content)
 
 def process_directory(directory):